@@ -1,8 +1,38 @@
-import requests
+import httpx
 import streamlit as st
 
 from web_api.web_api import explore_database as _explore_database
 
+API_URL = "http://localhost:8005"
+
+_GENRES = (
+    "drama",
+    "animation",
+    "music",
+    "action",
+    "history",
+    "comedy",
+    "fantasy",
+    "family",
+    "war",
+    "documentation",
+    "sport",
+    "thriller",
+    "scifi",
+    "reality",
+    "european",
+    "western",
+    "romance",
+    "crime",
+    "horror",
+)
+
+
+@st.cache_resource
+def _http_client():
+    """ Shared HTTP client so API calls reuse warm keep-alive connections. """
+    return httpx.Client(base_url=API_URL, limits=httpx.Limits(max_connections=16))
+
 
 def configure_page():
     """ Configure the Streamlit page with title and initial sidebar state. """
@@ -25,49 +55,64 @@ def page_navigation():
     return selected_page
 
 
+def _json(response):
+    """ Return the decoded body of a successful response, raising on HTTP errors. """
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=3600, max_entries=512)
+def _get_recs_by_genre(genre, target_score):
+    """ Fetch (and cache) recommendations for a genre and target IMDb score. """
+    response = _http_client().get(
+        "/recommendations/genre-target-score",
+        params={"genre_type": genre, "target_imdb_score": target_score},
+    )
+    return _json(response)
+
+
+@st.cache_data(ttl=3600, max_entries=512)
+def _get_recs_by_actor(actor_name):
+    """ Fetch (and cache) recommendations for an actor. """
+    response = _http_client().get("/recommendations/actor", params={"name": actor_name})
+    return _json(response)
+
+
+@st.cache_data(ttl=3600, max_entries=512)
+def _get_recs_by_director(director_name):
+    """ Fetch (and cache) recommendations for a director. """
+    response = _http_client().get(
+        "/recommendations/director", params={"name": director_name}
+    )
+    return _json(response)
+
+
+def _show_recommendations(fetch, *args):
+    """ Fetch recommendations and render them as a list of titles. """
+    try:
+        recommendations = fetch(*args)
+    except httpx.HTTPStatusError:
+        st.error("Failed to fetch recommendations.")
+        return
+
+    if recommendations:
+        st.caption("## Recommendation:")
+        for media in recommendations:
+            st.caption(f"### {media['title']} ({media['release_year']})")
+    else:
+        st.write("No recommendations found.")
+
+
 def target_sore():
     st.caption("## Genre And Target IMDb Score (±0.5)")
-    genres = [
-        "drama",
-        "animation",
-        "music",
-        "action",
-        "history",
-        "comedy",
-        "fantasy",
-        "family",
-        "war",
-        "documentation",
-        "sport",
-        "thriller",
-        "scifi",
-        "reality",
-        "european",
-        "western",
-        "romance",
-        "crime",
-        "horror",
-    ]
 
     # Input fields for recommendations
-    genre = st.selectbox("Select genre:", options=genres)
+    genre = st.selectbox("Select genre:", options=_GENRES)
     target_score = st.slider("Select imdb score:", min_value=0, max_value=10, value=7)
 
     if st.button("Get Recommendation"):
         try:
-            response = requests.get(
-                f"http://localhost:8005/recommendations/genre-target-score?genre_type={genre}&target_imdb_score={target_score}"
-            )
-            if response.status_code == 200:
-                recommendations = response.json()
-                if recommendations:
-                    st.caption("## Recommendation:")
-                    for media in recommendations:
-                        st.caption(f"### {media['title']} ({media['release_year']})")
-                else:
-                    st.write("No recommendations found.")
-            else:
-                st.error("Failed to fetch recommendations.")
+            _show_recommendations(_get_recs_by_genre, genre, target_score)
         except Exception as e:
             st.error(f"An error occurred: {e}")
 
@@ -89,19 +134,7 @@ def favorite_actor():
 
     if st.button("Get Recommendation"):
         try:
-            response = requests.get(
-                f"http://localhost:8005/recommendations/actor?name={actor_name}"
-            )
-            if response.status_code == 200:
-                recommendations = response.json()
-                if recommendations:
-                    st.caption("## Recommendation:")
-                    for media in recommendations:
-                        st.caption(f"### {media['title']} ({media['release_year']})")
-                else:
-                    st.write("No recommendations found.")
-            else:
-                st.error("Failed to fetch recommendations.")
+            _show_recommendations(_get_recs_by_actor, actor_name)
         except Exception as e:
             st.error(f"An error occurred: {e}")
 
@@ -123,19 +156,7 @@ def favorite_director():
 
     if st.button("Get Recommendation"):
         try:
-            response = requests.get(
-                f"http://localhost:8005/recommendations/director?name={director_name}"
-            )
-            if response.status_code == 200:
-                recommendations = response.json()
-                if recommendations:
-                    st.caption("## Recommendation:")
-                    for media in recommendations:
-                        st.caption(f"### {media['title']} ({media['release_year']})")
-                else:
-                    st.write("No recommendations found.")
-            else:
-                st.error("Failed to fetch recommendations.")
+            _show_recommendations(_get_recs_by_director, director_name)
         except Exception as e:
             st.error(f"An error occurred: {e}")
 
@@ -1,7 +1,9 @@
 import sqlalchemy as sql
+import sqlalchemy.ext.asyncio as asyncio_ext
 import sqlalchemy.ext.declarative as declarative
 import sqlalchemy.orm as orm
 import os
+import uuid
 
 from dotenv import load_dotenv
 
@@ -10,8 +12,54 @@ load_dotenv()
 
 db_url = os.getenv("DB_URL")
 
-engine = sql.create_engine(db_url)
+# Behind PgBouncer (transaction pooling) the app pools stay small and
+# asyncpg must not rely on prepared statements surviving between transactions
+use_pgbouncer = os.getenv("DB_PGBOUNCER", "").lower() in ("1", "true", "yes")
 
-SessionLocal = orm.sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine_options = dict(
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+)
+
+# Each API process holds both pools, so together they must fit the server's
+# max_connections divided by the number of workers: 10 + 25 = 35 by default
+engine = sql.create_engine(
+    db_url,
+    # CRUD endpoints are low traffic
+    pool_size=int(os.getenv("DB_POOL_SIZE", 2 if use_pgbouncer else 5)),
+    max_overflow=int(os.getenv("DB_POOL_OVERFLOW", 3 if use_pgbouncer else 5)),
+    **engine_options,
+)
+
+SessionLocal = orm.sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# Read-only recommendation endpoints run on asyncpg so they don't pin a worker thread
+async_connect_args = (
+    {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+    if use_pgbouncer
+    else {}
+)
+
+async_engine = asyncio_ext.create_async_engine(
+    sql.make_url(db_url).set(drivername="postgresql+asyncpg"),
+    connect_args=async_connect_args,
+    # Recommendation endpoints carry most of the traffic
+    pool_size=int(os.getenv("DB_ASYNC_POOL_SIZE", 5 if use_pgbouncer else 15)),
+    max_overflow=int(os.getenv("DB_ASYNC_POOL_OVERFLOW", 5 if use_pgbouncer else 10)),
+    **engine_options,
+)
+
+AsyncSessionLocal = asyncio_ext.async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
 
 Base = declarative.declarative_base()
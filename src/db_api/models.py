@@ -1,4 +1,14 @@
-from sqlalchemy import Column, Integer, String, Table, ForeignKey, Numeric, Enum
+from sqlalchemy import (
+    Column,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    REAL,
+    SmallInteger,
+    String,
+    Table,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -7,29 +17,37 @@ Base = declarative_base()
 media_actor_association = Table(
     "media_actor",
     Base.metadata,
-    Column("media_id", String(9), ForeignKey("media.id")),
-    Column("actor_id", Integer, ForeignKey("actor.actor_id")),
+    Column("media_id", String(9), ForeignKey("media.id"), primary_key=True),
+    Column("actor_id", Integer, ForeignKey("actor.actor_id"), primary_key=True),
+    Index("ix_media_actor_actor_id_media_id", "actor_id", "media_id"),
 )
 
 media_director_association = Table(
     "media_director",
     Base.metadata,
-    Column("media_id", String(9), ForeignKey("media.id")),
-    Column("director_id", Integer, ForeignKey("director.director_id")),
+    Column("media_id", String(9), ForeignKey("media.id"), primary_key=True),
+    Column(
+        "director_id", Integer, ForeignKey("director.director_id"), primary_key=True
+    ),
+    Index("ix_media_director_director_id_media_id", "director_id", "media_id"),
 )
 
 media_genre_association = Table(
     "media_genre",
     Base.metadata,
-    Column("media_id", String(9), ForeignKey("media.id")),
-    Column("genre_id", Integer, ForeignKey("genre.genre_id")),
+    Column("media_id", String(9), ForeignKey("media.id"), primary_key=True),
+    Column("genre_id", Integer, ForeignKey("genre.genre_id"), primary_key=True),
+    Index("ix_media_genre_genre_id_media_id", "genre_id", "media_id"),
 )
 
 media_production_association = Table(
     "media_production",
     Base.metadata,
-    Column("media_id", String(9), ForeignKey("media.id")),
-    Column("country_id", Integer, ForeignKey("production.country_id")),
+    Column("media_id", String(9), ForeignKey("media.id"), primary_key=True),
+    Column(
+        "country_id", Integer, ForeignKey("production.country_id"), primary_key=True
+    ),
+    Index("ix_media_production_country_id_media_id", "country_id", "media_id"),
 )
 
 
@@ -81,10 +99,16 @@ class Media(Base):
     release_year = Column(Integer)
     age_certification = Column(String(5))
     runtime = Column(Integer)
-    seasons = Column(Numeric(precision=4, scale=2), nullable=True)
-    imdb_score = Column(Numeric(precision=3, scale=2), nullable=True)
+    seasons = Column(SmallInteger, nullable=True)
+    imdb_score = Column(REAL, nullable=True)
     imdb_votes = Column(Integer)
 
+    __table_args__ = (
+        Index("ix_media_score_votes", imdb_score.desc(), imdb_votes.desc()),
+        # Lets genre/score recommendations walk media by votes and stop early
+        Index("ix_media_votes", imdb_votes.desc()),
+    )
+
     actor = relationship(
         "Actor", secondary=media_actor_association, back_populates="media"
     )
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 import pydantic as pydantic
 
@@ -43,3 +43,37 @@ class Media(pydantic.BaseModel):
 class MediaRecommendation(pydantic.BaseModel):
     title: str
     release_year: int
+
+
+class RecommendationType(Enum):
+    GENRE_TARGET_SCORE = "genre-target-score"
+    ACTOR = "actor"
+    DIRECTOR = "director"
+
+
+# Upper bound on the queries accepted by one batch request
+MAX_BATCH_QUERIES = 20
+
+
+class RecommendationQuery(pydantic.BaseModel):
+    type: RecommendationType
+    genre_type: Optional[str] = None
+    target_imdb_score: float = 7.0
+    name: Optional[str] = None
+
+    @pydantic.model_validator(mode="after")
+    def check_required_field(self):
+        required = (
+            "genre_type"
+            if self.type == RecommendationType.GENRE_TARGET_SCORE
+            else "name"
+        )
+        if getattr(self, required) is None:
+            raise ValueError(
+                f"'{required}' is required for '{self.type.value}' queries"
+            )
+        return self
+
+
+class RecommendationBatch(pydantic.BaseModel):
+    queries: List[RecommendationQuery] = pydantic.Field(max_length=MAX_BATCH_QUERIES)
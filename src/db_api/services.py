@@ -1,6 +1,9 @@
 import logging
 
+import sqlalchemy as _sql
+import sqlalchemy.ext.asyncio as _asyncio
 import sqlalchemy.orm as _orm
+from sqlalchemy.dialects import postgresql as _postgresql
 
 from . import database as _database
 from . import models as _models
@@ -28,6 +31,17 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Provide an asynchronous database session for the current request.
+
+    Yields:
+        _asyncio.AsyncSession: A SQLAlchemy asynchronous database session.
+    """
+    async with _database.AsyncSessionLocal() as db:
+        yield db
+
+
 def get_actor(db: _orm.Session, name: str):
     """
     Retrieve an actor by name from the database.
@@ -42,6 +56,21 @@ def get_actor(db: _orm.Session, name: str):
     return db.query(_models.Actor).filter(_models.Actor.name == name).first()
 
 
+def load_actor_map(db: _orm.Session):
+    """
+    Load every actor name with its id in a single query.
+
+    Args:
+        db (_orm.Session): The SQLAlchemy database session.
+
+    Returns:
+        dict: A dictionary mapping actor names to actor ids.
+    """
+    return dict(
+        db.execute(_sql.select(_models.Actor.name, _models.Actor.actor_id)).all()
+    )
+
+
 def create_actor(db: _orm.Session, actor: _schemas.CreateActor):
     """
     Create a new actor in the database.
@@ -51,12 +80,15 @@ def create_actor(db: _orm.Session, actor: _schemas.CreateActor):
         actor (_schemas.CreateActor): The actor information to create.
 
     Returns:
-        _models.Actor: The created actor object.
+        _models.Actor: The created actor object, or None if the actor already exists.
     """
-    db_actor = _models.Actor(name=actor.name)
-    db.add(db_actor)
+    db_actor = db.scalars(
+        _postgresql.insert(_models.Actor)
+        .values(name=actor.name)
+        .on_conflict_do_nothing()
+        .returning(_models.Actor)
+    ).first()
     db.commit()
-    db.refresh(db_actor)
     return db_actor
 
 
@@ -74,6 +106,23 @@ def get_director(db: _orm.Session, name: str):
     return db.query(_models.Director).filter(_models.Director.name == name).first()
 
 
+def load_director_map(db: _orm.Session):
+    """
+    Load every director name with its id in a single query.
+
+    Args:
+        db (_orm.Session): The SQLAlchemy database session.
+
+    Returns:
+        dict: A dictionary mapping director names to director ids.
+    """
+    return dict(
+        db.execute(
+            _sql.select(_models.Director.name, _models.Director.director_id)
+        ).all()
+    )
+
+
 def create_director(db: _orm.Session, director: _schemas.CreateDirector):
     """
     Create a new director in the database.
@@ -83,12 +132,15 @@ def create_director(db: _orm.Session, director: _schemas.CreateDirector):
         director (_schemas.CreateDirector): The director information to create.
 
     Returns:
-        _models.Director: The created director object.
+        _models.Director: The created director object, or None if the director already exists.
     """
-    db_director = _models.Director(name=director.name)
-    db.add(db_director)
+    db_director = db.scalars(
+        _postgresql.insert(_models.Director)
+        .values(name=director.name)
+        .on_conflict_do_nothing()
+        .returning(_models.Director)
+    ).first()
     db.commit()
-    db.refresh(db_director)
     return db_director
 
 
@@ -115,27 +167,130 @@ def create_media(db: _orm.Session, media: _schemas.Media):
         media (_schemas.Media): The media information to create.
 
     Returns:
-        _models.Media: The created media object.
+        _models.Media: The created media object, or None if the media already exists.
     """
-    db_media = _models.Media(
-        id=media.id,
-        title=media.title,
-        type=media.type.value,
-        release_year=media.release_year,
-        age_certification=media.age_certification,
-        runtime=media.runtime,
-        seasons=media.seasons,
-        imdb_score=media.imdb_score,
-        imdb_votes=media.imdb_votes,
-    )
-    db.add(db_media)
+    db_media = db.scalars(
+        _postgresql.insert(_models.Media)
+        .values(
+            id=media.id,
+            title=media.title,
+            type=media.type.value,
+            release_year=media.release_year,
+            age_certification=media.age_certification,
+            runtime=media.runtime,
+            seasons=media.seasons,
+            imdb_score=media.imdb_score,
+            imdb_votes=media.imdb_votes,
+        )
+        .on_conflict_do_nothing()
+        .returning(_models.Media)
+    ).first()
     db.commit()
-    db.refresh(db_media)
     return db_media
 
 
-def recommend_by_sore(
-        db: _orm.Session,
+def bulk_create_actors(db: _orm.Session, rows: list):
+    """
+    Insert many actors with a single statement, skipping names already stored.
+
+    Args:
+        db (_orm.Session): The SQLAlchemy database session.
+        rows (List[dict]): The actors to create, e.g. {"name": "Johnny Depp"}.
+
+    Returns:
+        None
+    """
+    db.execute(_postgresql.insert(_models.Actor).on_conflict_do_nothing(), rows)
+    db.commit()
+
+
+def bulk_create_directors(db: _orm.Session, rows: list):
+    """
+    Insert many directors with a single statement, skipping names already stored.
+
+    Args:
+        db (_orm.Session): The SQLAlchemy database session.
+        rows (List[dict]): The directors to create, e.g. {"name": "Christopher Nolan"}.
+
+    Returns:
+        None
+    """
+    db.execute(_postgresql.insert(_models.Director).on_conflict_do_nothing(), rows)
+    db.commit()
+
+
+def bulk_create_media(db: _orm.Session, rows: list):
+    """
+    Insert many media entries with a single statement, skipping ones already stored.
+
+    Args:
+        db (_orm.Session): The SQLAlchemy database session.
+        rows (List[dict]): The media to create, keyed by _models.Media attribute names.
+
+    Returns:
+        None
+    """
+    db.execute(_postgresql.insert(_models.Media).on_conflict_do_nothing(), rows)
+    db.commit()
+
+
+def bulk_associate_media(db: _orm.Session, association, rows: list):
+    """
+    Insert many media associations with a single statement.
+
+    Args:
+        db (_orm.Session): The SQLAlchemy database session.
+        association (sqlalchemy.Table): The association table, e.g. _models.media_actor_association.
+        rows (List[dict]): The links to create, e.g. {"media_id": "tm84618", "actor_id": 1}.
+
+    Returns:
+        None
+    """
+    db.execute(_postgresql.insert(association).on_conflict_do_nothing(), rows)
+    db.commit()
+
+
+_RECOMMENDATION_COLUMNS = (
+    _models.Media.title,
+    _models.Media.release_year,
+    _models.Media.imdb_votes,
+    _models.Media.imdb_score,
+)
+
+
+# EXISTS lets the planner walk media by votes and stop after the first 10 matches
+_RECOMMEND_BY_SCORE_SQL = _sql.text(
+    """
+    SELECT m.title, m.release_year, m.imdb_votes, m.imdb_score
+    FROM media m
+    WHERE m.imdb_score BETWEEN :min_score AND :max_score
+      AND EXISTS (
+          SELECT 1
+          FROM media_genre mg
+          JOIN genre g ON g.genre_id = mg.genre_id
+          WHERE mg.media_id = m.id AND g.genre_type = :genre
+      )
+    ORDER BY m.imdb_votes DESC
+    LIMIT 10
+    """
+)
+
+
+def _to_recommendations(rows):
+    """
+    Convert recommendation result rows into dictionaries.
+
+    Args:
+        rows (List[Row]): Rows holding the columns in _RECOMMENDATION_COLUMNS.
+
+    Returns:
+        List[dict]: A list of recommended media information as dictionaries.
+    """
+    return [row._asdict() for row in rows]
+
+
+async def recommend_by_sore(
+        db: _asyncio.AsyncSession,
         genre_type: str,
         target_imdb_score: float,
         score_range: float = 0.5,
@@ -144,7 +299,7 @@ def recommend_by_sore(
     Recommend media based on genre and IMDb score around a specified target.
 
     Args:
-        db (_orm.Session): The SQLAlchemy database session.
+        db (_asyncio.AsyncSession): The SQLAlchemy asynchronous database session.
         genre_type (str): The genre type to filter media by.
         target_imdb_score (float): The target IMDb score.
         score_range (float, optional): The range for IMDb scores (default is 0.5).
@@ -156,94 +311,85 @@ def recommend_by_sore(
     min_imdb_score = target_imdb_score - score_range
     max_imdb_score = target_imdb_score + score_range
 
-    recommended_media = (
-        db.query(_models.Media)
-        .join(_models.Media.genre)
-        .filter(_models.Genre.genre_type == genre_type)
-        .filter(_models.Media.imdb_score >= min_imdb_score)
-        .filter(_models.Media.imdb_score <= max_imdb_score)
-        .order_by(_models.Media.imdb_votes.desc())
-        .limit(10)
-        .all()
+    recommended_media = await db.execute(
+        _RECOMMEND_BY_SCORE_SQL,
+        {"min_score": min_imdb_score, "max_score": max_imdb_score, "genre": genre_type},
     )
 
-    media_list = []
-    for media in recommended_media:
-        media_info = {
-            "title": media.title,
-            "release_year": media.release_year,
-            "imdb_votes": float(media.imdb_votes),
-            "imdb_score": float(media.imdb_score),
-        }
-        media_list.append(media_info)
+    return _to_recommendations(recommended_media)
 
-    return media_list
 
-
-def recommend_by_actor(db: _orm.Session, name: str):
+async def recommend_by_actor(db: _asyncio.AsyncSession, name: str):
     """
     Recommend media based on a specific actor.
 
     Args:
-        db (_orm.Session): The SQLAlchemy database session.
+        db (_asyncio.AsyncSession): The SQLAlchemy asynchronous database session.
         name (str): The name of the actor.
 
     Returns:
         List[dict]: A list of recommended media information as dictionaries.
     """
 
-    recommended_media = (
-        db.query(_models.Media)
+    recommended_media = await db.execute(
+        _sql.select(*_RECOMMENDATION_COLUMNS)
         .join(_models.media_actor_association)
         .join(_models.Actor)
-        .filter(_models.Actor.name == name)
+        .where(_models.Actor.name == name)
         .order_by(_models.Media.imdb_score.desc(), _models.Media.imdb_votes.desc())
         .limit(10)
-        .all()
     )
 
-    media_list = []
-    for media in recommended_media:
-        media_info = {
-            "title": media.title,
-            "release_year": media.release_year,
-            "imdb_votes": float(media.imdb_votes),
-            "imdb_score": float(media.imdb_score),
-        }
-        media_list.append(media_info)
-
-    return media_list
+    return _to_recommendations(recommended_media)
 
 
-def recommend_by_director(db: _orm.Session, name: str):
+async def recommend_by_director(db: _asyncio.AsyncSession, name: str):
     """
     Recommend media based on a specific director.
 
     Args:
-        db (_orm.Session): The SQLAlchemy database session.
+        db (_asyncio.AsyncSession): The SQLAlchemy asynchronous database session.
         name (str): The name of the director.
 
     Returns:
         List[dict]: A list of recommended media information as dictionaries.
     """
-    recommended_media = (
-        db.query(_models.Media)
+    recommended_media = await db.execute(
+        _sql.select(*_RECOMMENDATION_COLUMNS)
         .join(_models.media_director_association)
         .join(_models.Director)
-        .filter(_models.Director.name == name)
+        .where(_models.Director.name == name)
         .order_by(_models.Media.imdb_score.desc(), _models.Media.imdb_votes.desc())
         .limit(10)
-        .all()
     )
 
-    media_list = []
-    for media in recommended_media:
-        media_info = {
-            "title": media.title,
-            "release_year": media.release_year,
-            "imdb_votes": float(media.imdb_votes),
-            "imdb_score": float(media.imdb_score),
-        }
-        media_list.append(media_info)
-
-    return media_list
+    return _to_recommendations(recommended_media)
+
+
+async def recommend_batch(db: _asyncio.AsyncSession, queries: list):
+    """
+    Run several recommendation queries against a single database session.
+
+    Args:
+        db (_asyncio.AsyncSession): The SQLAlchemy asynchronous database session.
+        queries (List[_schemas.RecommendationQuery]): The recommendation queries to run.
+
+    Returns:
+        List[List[dict]]: The recommendations for each query, in request order.
+    """
+    recommendations = []
+    for query in queries:
+        if query.type == _schemas.RecommendationType.GENRE_TARGET_SCORE:
+            recommendations.append(
+                await recommend_by_sore(
+                    db=db,
+                    genre_type=query.genre_type,
+                    target_imdb_score=query.target_imdb_score,
+                )
+            )
+        elif query.type == _schemas.RecommendationType.ACTOR:
+            recommendations.append(await recommend_by_actor(db=db, name=query.name))
+        elif query.type == _schemas.RecommendationType.DIRECTOR:
+            recommendations.append(await recommend_by_director(db=db, name=query.name))
+
+    return recommendations
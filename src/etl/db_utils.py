@@ -1,55 +1,205 @@
-import ast
+import io
 import logging
+import re
 
-from ast import literal_eval
-from itertools import chain
+from functools import lru_cache
 
+import pandas as pd
 import sqlalchemy as sql
 from dotenv import load_dotenv
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker, load_only
-
-from data_models import Actor, Base, Director, Media, Genre, Production
+from sqlalchemy.orm import sessionmaker
+
+from data_models import (
+    Actor,
+    Base,
+    Director,
+    Media,
+    Genre,
+    Production,
+    media_actor_association,
+    media_director_association,
+    media_genre_association,
+    media_production_association,
+)
 
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Media attributes loaded from the titles DataFrame; "type" must match the enum values
+MEDIA_COLUMNS = [
+    "id",
+    "title",
+    "type",
+    "release_year",
+    "age_certification",
+    "runtime",
+    "seasons",
+    "imdb_score",
+    "imdb_votes",
+]
+
+# Upper bound on bound parameters per IN (...) lookup
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Tables whose secondary indexes are built once after the load instead of
+# being maintained row by row
+BULK_LOAD_TABLES = [
+    Media.__table__,
+    media_actor_association,
+    media_director_association,
+    media_genre_association,
+    media_production_association,
+]
+SECONDARY_INDEXES = [
+    index
+    for table in BULK_LOAD_TABLES
+    for index in table.indexes
+    if not index.unique
+]
+
+# INSERT constructs that support ON CONFLICT DO NOTHING, by dialect name
+CONFLICT_IGNORING_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Quoted items of a list literal such as "['drama', 'comedy']", quotes included
+LIST_ITEM_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+
+@lru_cache
+def get_engine(db_url):
+    """
+    Return the engine for db_url, creating it on first use.
+
+    Args:
+        db_url (str): Database connection URL.
+
+    Returns:
+        sqlalchemy.engine.Engine: A cached SQLAlchemy engine.
+    Raises:
+        SQLAlchemyError: If an error occurs while creating the engine.
+    """
+    try:
+        engine_options = {"insertmanyvalues_page_size": 1000}
+        if sql.make_url(db_url).get_driver_name() == "psycopg2":
+            # Use psycopg2's execute_batch for executemany statements that can't
+            # be rewritten into multi-row INSERTs
+            engine_options.update(
+                executemany_mode="values_plus_batch", executemany_batch_page_size=500
+            )
+        return sql.create_engine(db_url, **engine_options)
+
+    except SQLAlchemyError as e:
+        logger.error(f"An error occurred while creating the database engine: {e}")
+        raise
+
 
-def create_database_session(db_url):
+def init_schema(engine):
     """
-    Create a database session using the DB_URL from environment variables.
+    Create any missing tables. Call once before loading data.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The engine to create the tables with.
 
     Returns:
-        sqlalchemy.orm.Session: A SQLAlchemy database session.
+        None
     Raises:
-        SQLAlchemyError: If an error occurs while creating the session.
+        SQLAlchemyError: If an error occurs while creating the tables.
     """
     try:
-        engine = sql.create_engine(db_url)
         Base.metadata.create_all(engine)
-        Session = sessionmaker(bind=engine)
-        session = Session()
-
-        logger.info("Database session created successfully.")
-        return session
+        logger.info("Database schema initialized successfully.")
 
     except SQLAlchemyError as e:
-        logger.error(f"An error occurred while creating the database session: {e}")
+        logger.error(f"An error occurred while initializing the schema: {e}")
         raise
 
 
-def insert_entities(session, df, entity_type):
+def create_database_session(engine):
+    """
+    Create a database session bound to the given engine.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The engine to bind the session to.
+
+    Returns:
+        sqlalchemy.orm.Session: A SQLAlchemy database session.
+    """
+    session = sessionmaker(bind=engine)()
+    logger.info("Database session created successfully.")
+    return session
+
+
+def prepare_bulk_load(session):
     """
-    Insert entity data into the database.
+    Relax commit durability for the load. Only applies to PostgreSQL.
+
+    Must run inside the load transaction, as the setting is transaction-local.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy database session.
+
+    Returns:
+        None
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+
+    # Skip waiting on the WAL flush at commit; a failed load is simply re-run
+    session.execute(sql.text("SET LOCAL synchronous_commit = OFF"))
+
+
+def drop_secondary_indexes(session):
+    """
+    Drop the non-unique indexes of the media and association tables before a load.
+
+    Primary keys and unique constraints stay in place, as the load relies on them.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy database session.
+
+    Returns:
+        None
+    """
+    connection = session.connection()
+    for index in SECONDARY_INDEXES:
+        index.drop(connection, checkfirst=True)
+
+
+def rebuild_secondary_indexes(session):
+    """
+    Recreate the indexes dropped by drop_secondary_indexes and refresh statistics.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy database session.
+
+    Returns:
+        None
+    """
+    connection = session.connection()
+    for index in SECONDARY_INDEXES:
+        index.create(connection, checkfirst=True)
+
+    # Give the planner fresh statistics for the newly loaded rows
+    if connection.dialect.name == "postgresql":
+        for table in BULK_LOAD_TABLES:
+            session.execute(sql.text(f"ANALYZE {table.name}"))
+    logger.info("Secondary indexes rebuilt.")
+
+
+def insert_entities(session, df, entity_type, entity_lookup):
+    """
+    Insert the entities of df that are not in entity_lookup yet.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
         df (pd.DataFrame): The DataFrame containing entity data.
         entity_type (str): The type of entity to insert ("actor" or "director").
+        entity_lookup (pd.DataFrame): Names and IDs already in the database, as from retrieve_lookup.
 
     Returns:
-        list: A list of inserted entity objects.
+        pd.DataFrame: entity_lookup extended with the inserted names and IDs.
     Raises:
         SQLAlchemyError: If an error occurs during insertion.
     """
@@ -60,42 +210,35 @@ def insert_entities(session, df, entity_type):
 
     entity_role = entity_type.upper()
 
-    try:
-        entity_df = df.loc[df["role"] == entity_role, "name"]
-        unique_entities = entity_df.unique()
+    entity_id = entity_class.__mapper__.primary_key[0]
 
-        # Create instances of the entity
-        entities = [entity_class(name=name) for name in unique_entities]
-
-        session.add_all(entities)
-        session.commit()
+    try:
+        # Strip before de-duplicating so "Name " and "Name" load as one entity
+        names = (
+            df.loc[df["role"] == entity_role, "name"].str.strip().drop_duplicates()
+        )
+        # Names seen in earlier chunks are already loaded
+        unique_entities = names[~names.isin(entity_lookup["name"])]
+
+        # One multi-row INSERT instead of an ORM object per name; RETURNING hands
+        # back the new IDs so the lookup never has to be re-read
+        inserted = entity_lookup.iloc[:0]
+        if len(unique_entities):
+            result = session.execute(
+                sql.insert(entity_class).returning(entity_class.name, entity_id),
+                [{"name": name} for name in unique_entities],
+            )
+            inserted = pd.DataFrame(result.all(), columns=entity_lookup.columns)
 
         logger.info(f"{entity_role} table - finished.")
-        return entities
+        return pd.concat([entity_lookup, inserted], ignore_index=True)
 
     except SQLAlchemyError as e:
         logger.exception(
             f"An error occurred while uploading {entity_type} to database: {e}"
         )
-        session.rollback()
         raise
 
-    finally:
-        session.close()
-
-
-def extract_values(value):
-    """
-        Extract and return values from a string representation of a list or set.
-
-        Args:
-            value (str): A string representation of a list or set.
-
-        Returns:
-            set: A set containing the extracted values.
-        """
-    return set(literal_eval(value))
-
 
 def insert_entity(
         session, df, column_name, entity_class, model_type, filter_value=None
@@ -119,35 +262,33 @@ def insert_entity(
     """
 
     try:
-        entity_df = df[[column_name]]
-        unique_entities = set(
-            chain.from_iterable(entity_df[column_name].apply(extract_values))
+        # Tokenize each distinct list literal once, then flatten with explode
+        items = (
+            df[column_name]
+            .drop_duplicates()
+            .str.findall(LIST_ITEM_PATTERN)
+            .explode()
+            .dropna()
         )
+        unique_entities = set(items.str[1:-1].unique())
 
         if filter_value:
             unique_entities.discard(filter_value)
 
-        entities = []
-
-        for value in unique_entities:
-            entity = entity_class()
-            setattr(entity, model_type, value)
-            entities.append(entity)
-
-        session.add_all(entities)
-        session.commit()
+        # One multi-row INSERT instead of an ORM object per value
+        if unique_entities:
+            session.execute(
+                sql.insert(entity_class),
+                [{model_type: value} for value in unique_entities],
+            )
         logger.info(f"{entity_class.__name__} table - finished.")
 
     except SQLAlchemyError as e:
         logger.exception(
             f"An error occurred while inserting {entity_class.__name__}: {e}"
         )
-        session.rollback()
         raise
 
-    finally:
-        session.close()
-
 
 def insert_genre(session, df):
     """
@@ -179,6 +320,41 @@ def insert_production(session, df):
     )
 
 
+def copy_media(session, media_df):
+    """
+    Stream media rows into PostgreSQL with COPY ... FROM STDIN.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session on a psycopg2 engine.
+        media_df (pd.DataFrame): The media rows, one column per MEDIA_COLUMNS entry.
+
+    Returns:
+        None
+    """
+    columns = {attr: Media.__mapper__.columns[attr] for attr in MEDIA_COLUMNS}
+    # Integer columns with gaps come in as floats, which COPY rejects ("2.0")
+    integer_columns = {
+        attr: "Int64"
+        for attr, column in columns.items()
+        if isinstance(column.type, sql.Integer)
+    }
+
+    # Empty unquoted CSV fields are read back as NULL
+    buffer = io.StringIO()
+    media_df.astype(integer_columns).to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    column_names = ", ".join(column.name for column in columns.values())
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {Media.__tablename__} ({column_names}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
 def insert_media(session, df):
     """
     Insert media information into the database.
@@ -194,36 +370,49 @@ def insert_media(session, df):
     filtered_df = df.drop_duplicates(subset=["title"])
 
     try:
-        media_instances = [
-            Media(
-                id=row["id"],
-                title=row["title"],
-                type=row["type"],  # Ensure this matches enum values in the database
-                release_year=row["release_year"],
-                age_certification=row["age_certification"],
-                runtime=row["runtime"],
-                seasons=row["seasons"],
-                imdb_score=row["imdb_score"],
-                imdb_votes=row["imdb_votes"],
+        media_df = filtered_df[MEDIA_COLUMNS]
+        if session.get_bind().dialect.driver == "psycopg2":
+            copy_media(session, media_df)
+        else:
+            # Missing values must reach the driver as None rather than NaN/NA
+            records = (
+                media_df.astype(object)
+                .where(media_df.notna(), None)
+                .to_dict(orient="records")
             )
-            for index, row in filtered_df.iterrows()
-        ]
 
-        # Bulk insert the prepared media instances
-        session.bulk_save_objects(media_instances)
-        session.commit()
+            # One executemany, batched by insertmanyvalues into multi-row INSERTs
+            session.execute(sql.insert(Media), records)
         logger.info("Media table - finished.")
 
     except Exception as e:
         logger.exception(f"An error occurred while uploading to the database: {e}")
-        session.rollback()
         raise
 
-    finally:
-        session.close()
-
 
 # RELATIONS
+def chunked(values, size=IN_CLAUSE_CHUNK_SIZE):
+    """
+    Split values into consecutive lists of at most size items.
+
+    Args:
+        values (iterable): The values to split.
+        size (int): The maximum number of values per chunk.
+
+    Returns:
+        generator: Lists of up to size values.
+    """
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+# Built once so every chunk reuses the same cached compiled statement
+_MEDIA_ID_LOOKUP = sql.select(Media.id).where(
+    Media.id.in_(sql.bindparam("ids", expanding=True))
+)
+
+
 def retrieve_media_instances(session, media_ids):
     """
     Retrieve media instances by their IDs.
@@ -233,63 +422,58 @@ def retrieve_media_instances(session, media_ids):
         media_ids (list): A list of media IDs to retrieve.
 
     Returns:
-        dict: A dictionary mapping media IDs to media instances.
+        set: The subset of media_ids present in the media table.
     """
-    return {
-        media.id: media
-        for media in session.query(Media).filter(Media.id.in_(media_ids)).all()
-    }
+    # Only existence matters, so fetch bare ids instead of ORM instances;
+    # the lookup is chunked to keep each IN (...) list short
+    existing_ids = set()
+    for chunk in chunked(dict.fromkeys(media_ids)):
+        result = session.execute(_MEDIA_ID_LOOKUP, {"ids": chunk})
+        existing_ids.update(result.scalars())
+    return existing_ids
 
 
-def retrieve_existing_entities(session, EntityModel, entity_names):
+def retrieve_lookup(session, key_column, id_column):
     """
-    Retrieve existing entities by their names.
+    Retrieve a full-table lookup from a key column to an ID column.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
-        EntityModel (sqlalchemy.ext.declarative.api.DeclarativeBase): The SQLAlchemy class representing the entity.
-        entity_names (list): A list of entity names to retrieve.
+        key_column (sqlalchemy.orm.InstrumentedAttribute): The column to key by, e.g. Actor.name.
+        id_column (sqlalchemy.orm.InstrumentedAttribute): The ID column, e.g. Actor.actor_id.
 
     Returns:
-        dict: A dictionary mapping entity names to entity instances.
+        pd.DataFrame: Stripped keys and IDs, in columns named after the table columns.
     """
-    entities = (
-        session.query(EntityModel)
-        .filter(EntityModel.name.in_(entity_names))
-        .options(load_only(EntityModel.name))
-        .all()
+    lookup = pd.read_sql(sql.select(key_column, id_column), session.connection())
+    lookup[key_column.name] = lookup[key_column.name].str.strip()
+    # Rows whose keys differ only by whitespace map to the lowest ID, so a merge
+    # against the lookup never links one credit to several entities
+    return lookup.sort_values(id_column.name).drop_duplicates(
+        subset=key_column.name, ignore_index=True
     )
-    return {entity.name.strip(): entity for entity in entities}
 
 
-def create_relationships(
-        session, entity_data, media_dict, entity_dict, relationship_attr
-):
+def insert_ignoring_conflicts(session, table):
     """
-    Create relationships between media and entities.
+    Build an INSERT for table that skips rows which already exist, where supported.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
-        entity_data (pd.DataFrame): A DataFrame containing entity data.
-        media_dict (dict): A dictionary mapping media IDs to media instances.
-        entity_dict (dict): A dictionary mapping entity names to entity instances.
-        relationship_attr (str): The name of the relationship attribute in the Media class.
+        table (sqlalchemy.Table): The table to insert into.
 
     Returns:
-        None
+        sqlalchemy.sql.Insert: The INSERT statement.
     """
-    for _, row in entity_data.iterrows():
-        media_id = row["id"]
-        entity_name = row["name"].strip()
+    insert = CONFLICT_IGNORING_INSERTS.get(session.get_bind().dialect.name)
+    if insert is None:
+        return table.insert()
+    return insert(table).on_conflict_do_nothing()
 
-        media = media_dict.get(media_id)
-        if media:
-            entity = entity_dict.get(entity_name)
-            if entity:
-                getattr(media, relationship_attr).append(entity)
 
-
-def insert_relationships(session, df, role, EntityModel, relationship_attr):
+def insert_relationships(
+        session, df, role, EntityModel, relationship_attr, media_ids, entity_lookup
+):
     """
     Insert relationships between media and entities based on the role.
 
@@ -299,155 +483,170 @@ def insert_relationships(session, df, role, EntityModel, relationship_attr):
         role (str): The role of the entities (e.g., "ACTOR" or "DIRECTOR").
         EntityModel (sqlalchemy.ext.declarative.api.DeclarativeBase): The SQLAlchemy class representing the entity.
         relationship_attr (str): The name of the relationship attribute in the Media class.
+        media_ids (set): IDs of the media present in the database.
+        entity_lookup (pd.DataFrame): Entity names and IDs from retrieve_lookup.
 
     Returns:
         None
     """
-    entity_data = df[df["role"] == role][["id", "name"]]
+    entity_data = df.loc[df["role"] == role, ["id", "name"]]
+    # Normalize once so the lookup keys and the merge keys match
+    entity_data["name"] = entity_data["name"].str.strip()
 
     try:
-        media_ids = entity_data["id"].tolist()
-        media_dict = retrieve_media_instances(session, media_ids)
-
-        entity_names = entity_data["name"].apply(lambda x: x.strip()).tolist()
-        entity_dict = retrieve_existing_entities(session, EntityModel, entity_names)
-
-        create_relationships(
-            session, entity_data, media_dict, entity_dict, relationship_attr
+        # Resolve (media_id, entity_id) pairs with a join instead of ORM appends
+        association = Media.__mapper__.relationships[relationship_attr].secondary
+        entity_id = EntityModel.__mapper__.primary_key[0].name
+        pairs = (
+            entity_data[entity_data["id"].isin(media_ids)]
+            .merge(entity_lookup, on="name")
+            .rename(columns={"id": "media_id"})[["media_id", entity_id]]
+            .drop_duplicates()
         )
-        session.commit()
+
+        if not pairs.empty:
+            # A credit repeated in a later chunk must not fail the load
+            session.execute(
+                insert_ignoring_conflicts(session, association),
+                pairs.to_dict("records"),
+            )
         logger.info(f"Media-{role} relationships - finished.")
 
     except SQLAlchemyError as e:
         logger.exception(
             f"An error occurred while inserting Media-{role} relationships: {e}"
         )
-        session.rollback()
         raise
 
-    finally:
-        session.close()
 
-
-def insert_media_actors_relations(session, df):
+def insert_media_actors_relations(session, df, media_ids, actor_lookup):
     """
     Insert relationships between media and actors.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
         df (pd.DataFrame): The DataFrame containing actor relationship data.
+        media_ids (set): IDs of the media present in the database.
+        actor_lookup (pd.DataFrame): Actor names and IDs from retrieve_lookup.
 
     Returns:
         None
     """
-    insert_relationships(session, df, "ACTOR", Actor, "actor")
+    insert_relationships(
+        session, df, "ACTOR", Actor, "actor", media_ids, actor_lookup
+    )
 
 
-def insert_media_directors_relations(session, df):
+def insert_media_directors_relations(session, df, media_ids, director_lookup):
     """
     Insert relationships between media and directors.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
         df (pd.DataFrame): The DataFrame containing director relationship data.
+        media_ids (set): IDs of the media present in the database.
+        director_lookup (pd.DataFrame): Director names and IDs from retrieve_lookup.
 
     Returns:
         None
     """
-    insert_relationships(session, df, "DIRECTOR", Director, "director")
+    insert_relationships(
+        session, df, "DIRECTOR", Director, "director", media_ids, director_lookup
+    )
 
 
-def insert_media_genre_relations(session, df):
+def explode_list_column(df, column_name):
+    """
+    Expand a column of list literals into one row per media and value.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing an "id" column and the list column.
+        column_name (str): The name of the column holding strings such as "['drama', 'comedy']".
+
+    Returns:
+        pd.DataFrame: A DataFrame with "media_id" and stripped column_name values.
+    """
+    links = df[["id", column_name]].rename(columns={"id": "media_id"})
+    links[column_name] = links[column_name].str.findall(LIST_ITEM_PATTERN)
+    links = links.explode(column_name).dropna(subset=[column_name])
+    # Drop the quotes matched around each item
+    links[column_name] = links[column_name].str[1:-1].str.strip()
+    return links
+
+
+def insert_media_genre_relations(session, df, media_ids, genre_lookup):
     """
     Insert relationships between media and genres.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
         df (pd.DataFrame): The DataFrame containing genre relationship data.
+        media_ids (set): IDs of the media present in the database.
+        genre_lookup (pd.DataFrame): Genre types and IDs from retrieve_lookup.
 
     Returns:
         None
     """
     df = df.drop_duplicates(subset=["title"])
-    media_ids = df["id"].tolist()
-    media_dict = retrieve_media_instances(session, media_ids)
-
-    genre_types = df["genres"].apply(lambda x: x.strip()).tolist()
-    existing_genres = session.query(Genre).options(load_only(Genre.genre_type)).all()
-    existing_genres_types = {
-        genre.genre_type.strip(): genre for genre in existing_genres
-    }
 
     try:
-        for _, row in df.iterrows():
-            media_id = row["id"]
-            genre_list_string = row["genres"]
-            genre_list = ast.literal_eval(genre_list_string)
-            genre_list = [genre.strip() for genre in genre_list]
-
-            media = media_dict.get(media_id)
-            if media:
-                for genre_type in genre_list:
-                    genre = existing_genres_types.get(genre_type)
-                    if genre:
-                        media.genre.append(genre)
-        session.commit()
+        links = explode_list_column(df[df["id"].isin(media_ids)], "genres")
+        pairs = (
+            links.merge(genre_lookup, left_on="genres", right_on="genre_type")[
+                ["media_id", "genre_id"]
+            ]
+            .drop_duplicates()
+            .to_dict("records")
+        )
+
+        # Write all links with one multi-row INSERT on the association table
+        if pairs:
+            session.execute(media_genre_association.insert(), pairs)
         logger.info(f"Media-Genre relationships - finished.")
 
     except SQLAlchemyError as e:
         logger.exception(
             "An error occurred while inserting Media-Genre relationships: {}".format(e)
         )
-        session.rollback()
         raise
-    finally:
-        session.close()
 
 
-def insert_media_production_relations(session, df):
+def insert_media_production_relations(session, df, media_ids, country_lookup):
     """
     Insert relationships between media and production countries.
 
     Args:
         session (sqlalchemy.orm.Session): A SQLAlchemy database session.
         df (pd.DataFrame): The DataFrame containing production country relationship data.
+        media_ids (set): IDs of the media present in the database.
+        country_lookup (pd.DataFrame): Country codes and IDs from retrieve_lookup.
 
     Returns:
         None
     """
     df = df.drop_duplicates(subset=["title"])
-    media_ids = df["id"].tolist()
-    media_dict = retrieve_media_instances(session, media_ids)
-
-    countries = df["production_countries"].apply(lambda x: x.strip()).tolist()
-    existing_countries = (
-        session.query(Production).options(load_only(Production.country_id)).all()
-    )
-    existing_countries_id = {
-        country.country.strip(): country for country in existing_countries
-    }
 
     try:
-        for _, row in df.iterrows():
-            media_id = row["id"]
-            country_list_string = row["production_countries"]
-            country_list = ast.literal_eval(country_list_string)
-            country_list = [country.strip() for country in country_list]
-
-            media = media_dict.get(media_id)
-            if media:
-                for country_id in country_list:
-                    country_id = existing_countries_id.get(country_id)
-                    if country_id:
-                        media.production.append(country_id)
-        session.commit()
+        links = explode_list_column(
+            df[df["id"].isin(media_ids)], "production_countries"
+        )
+        pairs = (
+            links.merge(
+                country_lookup, left_on="production_countries", right_on="country"
+            )[
+                ["media_id", "country_id"]
+            ]
+            .drop_duplicates()
+            .to_dict("records")
+        )
+
+        # Write all links with one multi-row INSERT on the association table
+        if pairs:
+            session.execute(media_production_association.insert(), pairs)
         logger.info(f"Media-Genre relationships - finished.")
 
     except SQLAlchemyError as e:
         logger.exception(
             "An error occurred while inserting Media-Genre relationships: {}".format(e)
         )
-        session.rollback()
         raise
-    finally:
-        session.close()
@@ -9,8 +9,9 @@ db_url = os.getenv("DB_URL")
 
 def main():
     try:
-        # Create database session
-        session = create_database_session(db_url)
+        # Create the schema once on the shared engine
+        engine = get_engine(db_url)
+        init_schema(engine)
 
         # File paths for data to be merged
         file_path1 = (
@@ -21,20 +22,44 @@ def main():
         )
 
         media_df = create_df(file_path2)
-        # Merge data
-        df = merge_dataframe(file_path1, file_path2)
-
-        insert_entities(session, df, "actor")
-        insert_entities(session, df, "director")
-        insert_genre(session, df)
-        insert_production(session, df)
-        insert_media(session, media_df)
-        insert_media_actors_relations(session, df)
-        insert_media_directors_relations(session, df)
-        insert_media_genre_relations(session, df)
-        insert_media_production_relations(session, df)
-
-        session.commit()
+        titles = prepare_titles(media_df)
+        credited_ids = set()
+
+        # One session and one transaction drive the whole load; it commits when
+        # the block exits and rolls back on any error
+        with create_database_session(engine) as session, session.begin():
+            prepare_bulk_load(session)
+            drop_secondary_indexes(session)
+
+            insert_media(session, media_df)
+            media_ids = retrieve_media_instances(session, titles["id"].unique())
+            actors = retrieve_lookup(session, Actor.name, Actor.actor_id)
+            directors = retrieve_lookup(session, Director.name, Director.director_id)
+
+            # Stream the credits so only one chunk is held in memory at a time
+            for credits in iter_credits(file_path1, titles["id"]):
+                actors = insert_entities(session, credits, "actor", actors)
+                directors = insert_entities(session, credits, "director", directors)
+                insert_media_actors_relations(session, credits, media_ids, actors)
+                insert_media_directors_relations(
+                    session, credits, media_ids, directors
+                )
+                credited_ids.update(credits["id"])
+
+            # Genres and countries come from the titles that have credits
+            df = titles[titles["id"].isin(credited_ids)]
+            insert_genre(session, df)
+            insert_production(session, df)
+            genres = retrieve_lookup(session, Genre.genre_type, Genre.genre_id)
+            countries = retrieve_lookup(
+                session, Production.country, Production.country_id
+            )
+
+            insert_media_genre_relations(session, df, media_ids, genres)
+            insert_media_production_relations(session, df, media_ids, countries)
+
+            rebuild_secondary_indexes(session)
+
         logger.info("ETL process completed successfully.")
 
     except Exception as e:
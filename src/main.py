@@ -2,13 +2,15 @@ from typing import Optional, List
 import logging
 
 import fastapi as _fastapi
+import fastapi.responses as _responses
+import sqlalchemy.ext.asyncio as _asyncio
 import sqlalchemy.orm as _orm
 from db_api import schemas as _schemas, models as _models, services as _services
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = _fastapi.FastAPI()
+app = _fastapi.FastAPI(default_response_class=_responses.ORJSONResponse)
 
 _services.create_database()
 
@@ -27,12 +29,12 @@ def create_actor(
     Returns:
         _schemas.Actor: The created actor.
     """
-    db_actor = _services.get_actor(db=db, name=actor.name)
-    if db_actor:
+    db_actor = _services.create_actor(db=db, actor=actor)
+    if not db_actor:
         raise _fastapi.HTTPException(
             status_code=400, detail="Actor is in the database already"
         )
-    return _services.create_actor(db=db, actor=actor)
+    return db_actor
 
 
 # Endpoint to get actor from database
@@ -71,12 +73,12 @@ def create_director(
     Returns:
         Director: The created director information.
     """
-    db_director = _services.get_director(db=db, name=director.name)
-    if db_director:
+    db_director = _services.create_director(db=db, director=director)
+    if not db_director:
         raise _fastapi.HTTPException(
             status_code=400, detail="Director is in the database already"
         )
-    return _services.create_director(db=db, director=director)
+    return db_director
 
 
 # Endpoint to get director from database
@@ -116,12 +118,12 @@ def create_media(
     Returns:
         Media: The created media information.
     """
-    db_media = _services.get_media(db=db, title=media.title)
-    if db_media:
+    db_media = _services.create_media(db=db, media=media)
+    if not db_media:
         raise _fastapi.HTTPException(
             status_code=400, detail="Media is in the database already"
         )
-    return _services.create_media(db=db, media=media)
+    return db_media
 
 
 # Endpoint to get media from database
@@ -167,9 +169,12 @@ def associate_actor_with_media(
     if not actor:
         raise _fastapi.HTTPException(status_code=404, detail="Actor not found")
 
-    if actor not in media.actor:
-        media.actor.append(actor)
-        db.commit()
+    # Insert the link row directly rather than loading media.actor to append to it
+    _services.bulk_associate_media(
+        db,
+        _models.media_actor_association,
+        [{"media_id": media_id, "actor_id": actor_id}],
+    )
 
     return {"message": "Actor associated with media successfully"}
 
@@ -203,9 +208,12 @@ def associate_director_with_media(
     if not director:
         raise _fastapi.HTTPException(status_code=404, detail="Director not found")
 
-    if director not in media.director:
-        media.director.append(director)
-        db.commit()
+    # Insert the link row directly rather than loading media.director to append to it
+    _services.bulk_associate_media(
+        db,
+        _models.media_director_association,
+        [{"media_id": media_id, "director_id": director_id}],
+    )
 
     return {"message": "Director associated with media successfully"}
 
@@ -214,10 +222,10 @@ def associate_director_with_media(
     "/recommendations/genre-target-score",
     response_model=List[_schemas.MediaRecommendation],
 )
-def get_recommendations(
+async def get_recommendations(
     genre_type: str,
     target_imdb_score: float = 7.0,
-    db: _orm.Session = _fastapi.Depends(_services.get_db),
+    db: _asyncio.AsyncSession = _fastapi.Depends(_services.get_async_db),
 ):
     """
     Get media recommendations based on genre and minimum IMDb score.
@@ -231,7 +239,7 @@ def get_recommendations(
         List[_schemas.MediaRecommendation]: A list of recommended media matching the genre and IMDb score criteria.
     """
     try:
-        recommendations = _services.recommend_by_sore(
+        recommendations = await _services.recommend_by_sore(
             db=db, genre_type=genre_type, target_imdb_score=target_imdb_score
         )
         return recommendations
@@ -243,8 +251,8 @@ def get_recommendations(
 
 
 @app.get("/recommendations/actor", response_model=List[_schemas.MediaRecommendation])
-def get_recommendations(
-    name: str, db: _orm.Session = _fastapi.Depends(_services.get_db)
+async def get_recommendations(
+    name: str, db: _asyncio.AsyncSession = _fastapi.Depends(_services.get_async_db)
 ):
     """
     Get media recommendations based on genre and target IMDb score.
@@ -257,7 +265,7 @@ def get_recommendations(
         List[_schemas.MediaRecommendation]: A list of recommended media.
     """
     try:
-        recommendations = _services.recommend_by_actor(db=db, name=name)
+        recommendations = await _services.recommend_by_actor(db=db, name=name)
         return recommendations
     except Exception as e:
         logger.error(f"Error in getting recommendations: {str(e)}")
@@ -267,8 +275,8 @@ def get_recommendations(
 
 
 @app.get("/recommendations/director", response_model=List[_schemas.MediaRecommendation])
-def get_recommendations(
-    name: str, db: _orm.Session = _fastapi.Depends(_services.get_db)
+async def get_recommendations(
+    name: str, db: _asyncio.AsyncSession = _fastapi.Depends(_services.get_async_db)
 ):
     """
     Get media recommendations based on the name of a director.
@@ -280,10 +288,37 @@ def get_recommendations(
         List[_schemas.MediaRecommendation]: A list of recommended media associated with the director.
     """
     try:
-        recommendations = _services.recommend_by_director(db=db, name=name)
+        recommendations = await _services.recommend_by_director(db=db, name=name)
         return recommendations
     except Exception as e:
         logger.error(f"Error in getting recommendations: {str(e)}")
         raise _fastapi.HTTPException(
             status_code=500, detail="An error occurred while fetching recommendations."
         )
+
+
+@app.post(
+    "/recommendations/batch",
+    response_model=List[List[_schemas.MediaRecommendation]],
+)
+async def get_batch_recommendations(
+    batch: _schemas.RecommendationBatch,
+    db: _asyncio.AsyncSession = _fastapi.Depends(_services.get_async_db),
+):
+    """
+    Get media recommendations for several queries in a single request.
+
+    Args:
+        batch (_schemas.RecommendationBatch): The recommendation queries to run.
+        db (Session, optional): The database session. Automatically provided by FastAPI.
+
+    Returns:
+        List[List[_schemas.MediaRecommendation]]: The recommendations for each query, in request order.
+    """
+    try:
+        return await _services.recommend_batch(db=db, queries=batch.queries)
+    except Exception as e:
+        logger.error(f"Error in getting recommendations: {str(e)}")
+        raise _fastapi.HTTPException(
+            status_code=500, detail="An error occurred while fetching recommendations."
+        )
@@ -1,3 +1,4 @@
+import pandas as pd
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
@@ -8,6 +9,21 @@ import streamlit as st
 load_dotenv('.env')
 
 
+@st.cache_resource
+def _session_factory(db_url):
+    """
+    Create the engine and session factory once and reuse them across reruns.
+
+    Parameters:
+        db_url (str): Database connection URL.
+
+    Returns:
+        sessionmaker: A factory for Sessions bound to a pooled engine.
+    """
+    engine = create_engine(db_url, pool_pre_ping=True, pool_size=5)
+    return sessionmaker(bind=engine)
+
+
 def explore_database(sql_query):
     """
     Execute the given SQL query on the database and return the results.
@@ -16,39 +32,37 @@ def explore_database(sql_query):
         sql_query (str): SQL query to be executed.
 
     Returns:
-        list of tuples: Results of the SQL query, returned as a list of tuples.
+        pd.DataFrame: Results of the SQL query in an Arrow-backed DataFrame.
     """
     if len(sql_query) == 0:
-        return []
+        return pd.DataFrame()
 
     # Convert the SQL query string to a textual SQL expression
     sql_query = text(sql_query)
 
-    # Create an engine that represents the core interface to the database
     db_url = os.getenv("DB_URL")
     if not db_url:
         st.error("Database URL is not set.")
-        return []
-
-    engine = create_engine(db_url)
+        return pd.DataFrame()
 
-    # Create a sessionmaker, which is a factory for creating new Session objects
-    Session = sessionmaker(bind=engine)
+    Session = _session_factory(db_url)
 
-    results = []
+    results = pd.DataFrame()
     try:
         # Create a new session
         with Session() as session:
-            # Execute the SQL query and fetch results
-            results = session.execute(sql_query).fetchall()
+            # Execute the SQL query and load results straight into Arrow columns
+            results = pd.read_sql_query(
+                sql_query, session.connection(), dtype_backend="pyarrow"
+            )
 
     except SQLAlchemyError as e:
         # Handle exceptions
         st.error(f"Database error: {e}")
-        return []
+        return pd.DataFrame()
 
     except Exception as e:
         st.error(f"An unexpected error occurred: {e}")
-        return []
+        return pd.DataFrame()
 
     return results